@@ -1,12 +1,156 @@
 import requests
-from typing import Dict, Any, Optional, List
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, List, Collection, Callable, NamedTuple, TYPE_CHECKING
+from collections import Counter
 import json
 import os 
+import time
+import hashlib
+from datetime import datetime
 import dotenv
 
+if TYPE_CHECKING:
+    # pandas is imported lazily so the Slack bot, which never builds a DataFrame, doesn't load it
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library json module
+    orjson = None
+
 dotenv.load_dotenv()
 
+# (connect, read) timeout in seconds for every API request
+REQUEST_TIMEOUT = (5, 30)
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 20,
+    status_forcelist: Collection[int] = (429, 500, 502, 503, 504),
+    allowed_methods: Collection[str] = Retry.DEFAULT_ALLOWED_METHODS,
+    retry_reads: bool = True
+) -> requests.Session:
+    """
+    Create a requests Session that keeps connections alive and retries transient failures.
+    
+    Connection errors and the given status codes are retried up to 5 times with
+    exponential backoff. Retries honour the Retry-After header, so rate-limited (429)
+    requests wait exactly as long as the server asks instead of a fixed delay.
+    
+    Args:
+        pool_connections: Number of host connection pools to cache
+        pool_maxsize: Maximum number of connections to keep per host
+        status_forcelist: HTTP status codes that trigger a retry
+        allowed_methods: HTTP methods that may be retried on those status codes
+        retry_reads: Whether to resend a request after a read timeout or dropped connection.
+            Disable for non-idempotent requests, which the server may already have processed.
+        
+    Returns:
+        A configured requests Session
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=1.0,
+        read=None if retry_reads else 0,
+        other=None if retry_reads else 0,
+        status_forcelist=status_forcelist,
+        allowed_methods=allowed_methods,
+        respect_retry_after_header=True,
+        raise_on_status=False  # Hand back the last response so callers can report the API error
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+# On-disk cache of page responses so reruns within the TTL skip the network. Expired
+# entries are kept for ETag revalidation until they pass the retention age.
+CACHE_DIR = ".foundry_cache"
+CACHE_TTL_SECONDS = 3600
+CACHE_RETENTION_SECONDS = 24 * 3600
+
+# Timestamp formats tried, in order, before falling back to ISO8601 inference
+TIMESTAMP_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z"
+]
+
+def json_dumps(value: Any) -> str:
+    """
+    Serialize a value to a compact JSON string, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(',', ':'))
+
+def json_dumps_bytes(value: Any) -> bytes:
+    """
+    Serialize a value to compact UTF-8 JSON bytes for a request body, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':')).encode()
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON from raw bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Shared session so paginated requests reuse the same TCP/TLS connection. Search
+# requests are POSTs but read-only, so they are safe to retry as well.
+_SESSION = create_session(allowed_methods=("GET", "POST"))
+_SESSION.headers.update({
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+})
+
+def _authorize(bearer_token: str) -> None:
+    """
+    Set the bearer token on the shared session, only touching the headers when it changes.
+    """
+    authorization = f"Bearer {bearer_token}"
+    if _SESSION.headers.get("Authorization") != authorization:
+        _SESSION.headers["Authorization"] = authorization
+
+class ThreadInsight(NamedTuple):
+    """
+    Typed view of a ThreadInsight object's properties.
+    
+    Field names match the Foundry property names; defaults apply when a property is missing or null.
+    """
+    internalInsightId: Optional[str] = None
+    timestamp: Optional[str] = None
+    insightTitle: str = "Untitled Insight"
+    deIdentifiedInsightSummary: str = "No de-identified summary available"
+    insightEvidence: str = "No evidence available"
+    senderRole: str = "Unknown role"
+    organizationDomain: str = "Unknown domain"
+    insightType: str = "Unknown type"
+    
+    @classmethod
+    def from_object(cls, obj: Dict[str, Any]) -> "ThreadInsight":
+        """
+        Build a ThreadInsight from a Foundry object, reading its properties in one pass.
+        
+        Args:
+            obj: Ontology object as returned by the API (properties are nested under "properties")
+            
+        Returns:
+            The ThreadInsight with unknown properties ignored and defaults for missing or null ones
+        """
+        properties = obj.get("properties", obj)
+        return cls(**{
+            name: properties[name]
+            for name in cls._fields
+            if properties.get(name) is not None
+        })
+
 def get_all_ontologies(base_url: str, bearer_token: str) -> List[Dict[str, Any]]:
     """
     Fetches a list of all ontologies from the Palantir Foundry API.
@@ -24,15 +168,11 @@ def get_all_ontologies(base_url: str, bearer_token: str) -> List[Dict[str, Any]]
     # Construct the API endpoint for fetching all ontologies
     api_url = f"{base_url}/api/v1/ontologies"
     
-    # Set up the authorization headers
-    headers = {
-        "Authorization": f"Bearer {bearer_token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    # Set up the authorization header on the shared session
+    _authorize(bearer_token)
     
     # Make the API request
-    response = requests.get(api_url, headers=headers)
+    response = _SESSION.get(api_url, timeout=REQUEST_TIMEOUT)
     
     # Check if the request was successful
     if not response.ok:
@@ -46,7 +186,167 @@ def get_all_ontologies(base_url: str, bearer_token: str) -> List[Dict[str, Any]]
         raise Exception(error_message)
     
     # Parse and return the JSON response
-    return response.json()
+    return json_loads(response.content)
+
+def _cache_key(api_url: str, params: Dict[str, Any]) -> str:
+    """
+    Build a cache key from the request URL, its query parameters and the bearer token,
+    so pages fetched with one token are never served to another.
+    """
+    raw = f"{_SESSION.headers.get('Authorization')}|{api_url}|{params.get('pageToken')}|{params.get('pageSize')}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+_cache_pruned = False
+
+def _prune_cache() -> None:
+    """
+    Delete cache files older than CACHE_RETENTION_SECONDS, once per process.
+    """
+    global _cache_pruned
+    if _cache_pruned:
+        return
+    _cache_pruned = True
+    
+    cutoff = time.time() - CACHE_RETENTION_SECONDS
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+    except OSError as e:
+        print(f"Could not prune cache: {str(e)}")
+
+def _read_cache(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a cached page entry, returning None if it is missing or unreadable.
+    """
+    try:
+        with open(os.path.join(CACHE_DIR, f"{key}.json"), "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _write_cache(key: str, data: Dict[str, Any], etag: Optional[str]) -> None:
+    """
+    Store a page response in the cache along with its ETag.
+    """
+    entry = {"stored_at": time.time(), "etag": etag, "data": data}
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _prune_cache()
+        # Write to a temporary file first so a crash never leaves a partial entry
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(json_dumps_bytes(entry))
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:
+        print(f"Could not write cache entry: {str(e)}")
+
+def _fetch_page(
+    api_url: str,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Fetch a single page from a paginated Foundry endpoint.
+    
+    Pages are requested with GET, or with POST when a JSON body is given (search endpoints).
+    
+    Successful GET responses are cached on disk for CACHE_TTL_SECONDS. Once an entry
+    expires its ETag is sent back so the server can answer 304 Not Modified. Search
+    requests are not cached: their queries usually carry a moving cutoff, so no two
+    runs share a key.
+    
+    Args:
+        api_url: The endpoint to request
+        params: Query parameters including pageSize and pageToken
+        body: JSON request body including pageSize and pageToken
+        
+    Returns:
+        The page's data and nextPageToken
+        
+    Raises:
+        Exception: If the API request fails
+    """
+    key = _cache_key(api_url, params) if body is None else None
+    cached = _read_cache(key) if key else None
+    headers = None
+    
+    if cached:
+        if time.time() - cached["stored_at"] < CACHE_TTL_SECONDS:
+            return cached["data"]
+        if cached.get("etag"):
+            headers = {"If-None-Match": cached["etag"]}
+    
+    # Make the API request
+    if body is None:
+        response = _SESSION.get(api_url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
+    else:
+        response = _SESSION.post(api_url, headers=headers, data=json_dumps_bytes(body), timeout=REQUEST_TIMEOUT)
+    
+    # Page unchanged since it was cached
+    if response.status_code == 304 and cached:
+        _write_cache(key, cached["data"], cached.get("etag"))
+        return cached["data"]
+    
+    # Check if the request was successful
+    if not response.ok:
+        error_message = f"API request failed with status {response.status_code}"
+        try:
+            error_details = response.json()
+            error_message += f": {error_details}"
+        except:
+            error_message += f": {response.text}"
+        raise Exception(error_message)
+    
+    # Parse the raw bytes directly and keep only what pagination needs
+    page_json = json_loads(response.content)
+    response_data = {"data": page_json.get("data", []), "nextPageToken": page_json.get("nextPageToken")}
+    
+    if key:
+        _write_cache(key, response_data, response.headers.get("ETag"))
+    return response_data
+
+def _fetch_all_pages(
+    fetch: Callable[[Optional[str]], Dict[str, Any]],
+    decode: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> List[Any]:
+    """
+    Collect every page of a cursor-paginated Foundry endpoint.
+    
+    Args:
+        fetch: Function returning the page for a given pageToken (None for the first page)
+        decode: Optional function applied to each object as it is collected
+        
+    Returns:
+        List of all objects from all pages, decoded if decode is given
+        
+    Raises:
+        Exception: If any page request fails
+    """
+    all_data = []
+    
+    page_token = None
+    
+    while True:
+        response_data = fetch(page_token)
+        
+        # Extract data from the response
+        if 'data' in response_data:
+            page_data = response_data['data']
+            if not isinstance(page_data, list):
+                page_data = [page_data]
+            all_data.extend(map(decode, page_data) if decode else page_data)
+        
+        # Get nextPageToken for the next request
+        page_token = response_data.get('nextPageToken')
+        if not page_token:
+            break
+        
+        print(f"Retrieved {len(all_data)} objects so far...")
+    
+    print(f"Total objects retrieved: {len(all_data)}")
+    return all_data
 
 def get_ontology_object(
     base_url: str,
@@ -73,20 +373,13 @@ def get_ontology_object(
     Raises:
         Exception: If the API request fails or the object is not found
     """
-    all_data = []
-    page_token = None
+    # Construct the API endpoint for the specific object
+    api_url = f"{base_url}/api/v1/ontologies/{ontology_rid}/objects/{object_name}"
     
-    while True:
-        # Construct the API endpoint for the specific object
-        api_url = f"{base_url}/api/v1/ontologies/{ontology_rid}/objects/{object_name}"
-        
-        # Set up the authorization headers
-        headers = {
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        
+    # Set up the authorization header on the shared session
+    _authorize(bearer_token)
+    
+    def fetch(page_token: Optional[str]) -> Dict[str, Any]:
         # Set up query parameters
         params = {
             "pageSize": page_size
@@ -96,43 +389,57 @@ def get_ontology_object(
         if page_token:
             params["pageToken"] = page_token
         
-        try:
-            # Make the API request
-            response = requests.get(api_url, headers=headers, params=params)
-            
-            # Check if the request was successful
-            if not response.ok:
-                error_message = f"API request failed with status {response.status_code}"
-                try:
-                    error_details = response.json()
-                    error_message += f": {error_details}"
-                except:
-                    error_message += f": {response.text}"
-                raise Exception(error_message)
-            
-            # Parse the JSON response
-            response_data = response.json()
-            
-            # Extract data from the response
-            if 'data' in response_data:
-                page_data = response_data['data']
-                if isinstance(page_data, list):
-                    all_data.extend(page_data)
-                else:
-                    all_data.append(page_data)
-            
-            # Get nextPageToken for the next request
-            page_token = response_data.get('nextPageToken')
-            if not page_token:
-                break
-                
-            print(f"Retrieved {len(all_data)} objects so far...")
-                
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Request failed: {str(e)}")
+        return _fetch_page(api_url, params)
     
-    print(f"Total objects retrieved: {len(all_data)}")
-    return all_data
+    return _fetch_all_pages(fetch)
+
+def search_ontology_object(
+    base_url: str,
+    ontology_rid: str,
+    object_name: str,
+    query: Dict[str, Any],
+    bearer_token: str,
+    page_size: int = 1000,
+    decode: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> List[Any]:
+    """
+    Search objects of a Foundry object type, letting the server apply the filter.
+    
+    Args:
+        base_url: The base URL of your Foundry instance (e.g., "https://your-company.palantirfoundry.com")
+        ontology_rid: The RID of the ontology (e.g., "ri.ontology.main.ontology.12345")
+        object_name: The name of the object type to search (e.g., "Person", "Organization")
+        query: Search query (e.g., {"type": "gte", "field": "properties.timestamp", "value": "2024-03-20T10:00:00Z"})
+        bearer_token: The bearer token for authentication
+        page_size: Number of items to fetch per page (default: 1000)
+        decode: Optional function applied to each object (e.g., ThreadInsight.from_object)
+        
+    Returns:
+        List of all matching objects from all pages, decoded if decode is given
+        
+    Raises:
+        Exception: If the API request fails
+    """
+    # Construct the API endpoint for searching the object type
+    api_url = f"{base_url}/api/v1/ontologies/{ontology_rid}/objects/{object_name}/search"
+    
+    # Set up the authorization header on the shared session
+    _authorize(bearer_token)
+    
+    def fetch(page_token: Optional[str]) -> Dict[str, Any]:
+        # Set up the request body
+        body = {
+            "query": query,
+            "pageSize": page_size
+        }
+        
+        # Add pageToken if we have one (omit for first request)
+        if page_token:
+            body["pageToken"] = page_token
+        
+        return _fetch_page(api_url, body=body)
+    
+    return _fetch_all_pages(fetch, decode)
 
 def list_ontology_objects(base_url: str, ontology_rid: str, bearer_token: str) -> List[Dict[str, Any]]:
     """
@@ -151,15 +458,11 @@ def list_ontology_objects(base_url: str, ontology_rid: str, bearer_token: str) -
     # Construct the API endpoint for listing objects
     api_url = f"{base_url}/api/v1/ontologies/{ontology_rid}/objectTypes"
     
-    # Set up the authorization headers
-    headers = {
-        "Authorization": f"Bearer {bearer_token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    # Set up the authorization header on the shared session
+    _authorize(bearer_token)
     
     # Make the API request
-    response = requests.get(api_url, headers=headers)
+    response = _SESSION.get(api_url, timeout=REQUEST_TIMEOUT)
     
     # Check if the request was successful
     if not response.ok:
@@ -173,7 +476,7 @@ def list_ontology_objects(base_url: str, ontology_rid: str, bearer_token: str) -
         raise Exception(error_message)
     
     # Parse and return the JSON response
-    return response.json()
+    return json_loads(response.content)
 
 def get_object_types(base_url: str, bearer_token: str, object_type: str) -> List[str]:
     """
@@ -191,15 +494,11 @@ def get_object_types(base_url: str, bearer_token: str, object_type: str) -> List
     # Construct the API endpoint for fetching object types
     api_url = f"{base_url}/api/v1/ontologies/{ontology_rid}/{object_type}"
     
-    # Set up the authorization headers
-    headers = {
-        "Authorization": f"Bearer {bearer_token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    # Set up the authorization header on the shared session
+    _authorize(bearer_token)
     
     # Make the API request
-    response = requests.get(api_url, headers=headers)
+    response = _SESSION.get(api_url, timeout=REQUEST_TIMEOUT)
     
     # Check if the request was successful
     if not response.ok:
@@ -213,9 +512,9 @@ def get_object_types(base_url: str, bearer_token: str, object_type: str) -> List
         raise Exception(error_message)
     
     # Parse and return the JSON response
-    return response.json().get("objectTypes", [])
+    return json_loads(response.content).get("objectTypes", [])
 
-def process_ontology_objects(objects: List[Dict[str, Any]]) -> pd.DataFrame:
+def process_ontology_objects(objects: List[Dict[str, Any]]) -> "pd.DataFrame":
     """
     Process the ontology objects and convert to a DataFrame.
     
@@ -225,6 +524,8 @@ def process_ontology_objects(objects: List[Dict[str, Any]]) -> pd.DataFrame:
     Returns:
         A pandas DataFrame containing the ontology objects
     """
+    import pandas as pd
+    
     if not objects:
         print("No objects found in this ontology.")
         return pd.DataFrame()
@@ -242,34 +543,7 @@ def process_ontology_objects(objects: List[Dict[str, Any]]) -> pd.DataFrame:
     
     return df
 
-def flatten_json(nested_json: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dict[str, Any]:
-    """
-    Flatten a nested JSON structure into a single level dictionary.
-    
-    Args:
-        nested_json: The nested JSON dictionary to flatten
-        parent_key: The parent key for nested structures
-        sep: Separator to use between keys
-        
-    Returns:
-        A flattened dictionary
-    """
-    items = {}
-    for key, value in nested_json.items():
-        # Remove any initial prefix (e.g., "data_", "properties_", etc.)
-        clean_key = key.split(sep)[-1] if sep in key else key
-        new_key = f"{parent_key}{sep}{clean_key}" if parent_key else clean_key
-        
-        if isinstance(value, dict):
-            items.update(flatten_json(value, new_key, sep=sep))
-        elif isinstance(value, list):
-            # Convert lists to strings to avoid DataFrame issues
-            items[new_key] = json.dumps(value)
-        else:
-            items[new_key] = value
-    return items
-
-def create_attribute_table(data: List[Dict[str, Any]]) -> pd.DataFrame:
+def create_attribute_table(data: List[Dict[str, Any]]) -> "pd.DataFrame":
     """
     Create a table from JSON data with attributes as columns.
     
@@ -279,18 +553,27 @@ def create_attribute_table(data: List[Dict[str, Any]]) -> pd.DataFrame:
     Returns:
         A pandas DataFrame with attributes as columns
     """
+    import pandas as pd
+    
     if not data:
         print("No data found to process.")
         return pd.DataFrame()
     
-    # Flatten each JSON object
-    flattened_data = [flatten_json(item) for item in data]
+    # Flatten the JSON objects and create the DataFrame in one pass
+    insights_df = pd.json_normalize(data, sep='.')
     
-    # Create DataFrame
-    insights_df = pd.DataFrame(flattened_data)
+    # Convert lists to strings to avoid DataFrame issues
+    for col in insights_df.select_dtypes(include='object').columns:
+        is_list = insights_df[col].map(lambda value: isinstance(value, list))
+        if is_list.any():
+            insights_df.loc[is_list, col] = insights_df.loc[is_list, col].map(json_dumps)
     
-    # Remove any remaining prefixes from column names
-    insights_df.columns = [col.split('_')[-1] if '_' in col else col for col in insights_df.columns]
+    # Drop prefixes from column names, keeping the full path where leaf names collide
+    leaf_names = Counter(col.split('.')[-1] for col in insights_df.columns)
+    insights_df.columns = [
+        col.split('.')[-1] if leaf_names[col.split('.')[-1]] == 1 else col.replace('.', '_')
+        for col in insights_df.columns
+    ]
     
     # Display information about the data
     print(f"\nProcessed {len(data)} objects")
@@ -301,7 +584,61 @@ def create_attribute_table(data: List[Dict[str, Any]]) -> pd.DataFrame:
     
     return insights_df
 
-def get_recent_data(df: pd.DataFrame, timestamp_col: str, last_updated_at: str) -> pd.DataFrame:
+def _detect_timestamp_format(sample: str) -> Optional[str]:
+    """
+    Find the strptime format matching a sample timestamp string.
+    
+    Args:
+        sample: A timestamp string from the data (e.g., "2024-03-20T10:00:00.123Z")
+        
+    Returns:
+        The matching format, or None if no known format applies
+    """
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            datetime.strptime(sample, fmt)
+            return fmt
+        except ValueError:
+            continue
+    return None
+
+def _parse_timestamps(timestamps: "pd.Series") -> "pd.Series":
+    """
+    Parse a Series of timestamp strings into UTC datetimes.
+    
+    Only the distinct values are parsed. An explicit format lets pandas use its fast
+    parser; ISO8601 inference is only used when the format can't be detected or
+    doesn't hold for every value.
+    
+    Args:
+        timestamps: Series of timestamp strings
+        
+    Returns:
+        Series of timezone-aware UTC datetimes
+    """
+    import pandas as pd
+    
+    # Parse each distinct string once; insights created in bursts share timestamps
+    unique_values = timestamps.dropna().unique()
+    if not len(unique_values):
+        return pd.Series(pd.NaT, index=timestamps.index, dtype="datetime64[ns, UTC]")
+    
+    fmt = _detect_timestamp_format(str(unique_values[0]))
+    
+    parsed = None
+    if fmt:
+        try:
+            parsed = pd.to_datetime(unique_values, format=fmt, utc=True)
+        except ValueError:
+            pass
+    
+    if parsed is None:
+        parsed = pd.to_datetime(unique_values, format='ISO8601', utc=True)
+    
+    # Map back onto the rows; missing values become NaT
+    return timestamps.map(pd.Series(parsed, index=unique_values))
+
+def get_recent_data(df: "pd.DataFrame", timestamp_col: str, last_updated_at: str) -> "pd.DataFrame":
     """
     Filter DataFrame to get only recent data based on timestamp.
     
@@ -316,20 +653,25 @@ def get_recent_data(df: pd.DataFrame, timestamp_col: str, last_updated_at: str)
     Raises:
         ValueError: If timestamp_col doesn't exist or last_updated_at is invalid
     """
+    import pandas as pd
+    
     if timestamp_col not in df.columns:
         raise ValueError(f"Timestamp column '{timestamp_col}' not found in DataFrame")
     
     try:
         # Convert last_updated_at to datetime using ISO8601 format
-        cutoff_time = pd.to_datetime(last_updated_at, format='ISO8601')
+        cutoff_time = pd.to_datetime(last_updated_at, format='ISO8601', utc=True)
         
-        # Convert timestamp column to datetime if it's not already
-        if not pd.api.types.is_datetime64_any_dtype(df[timestamp_col]):
-            # Handle potential string timestamps with milliseconds and timezone
-            df[timestamp_col] = pd.to_datetime(df[timestamp_col], format='ISO8601')
+        # Parse into a local Series so the caller's DataFrame is left untouched
+        timestamps = df[timestamp_col]
+        if pd.api.types.is_datetime64_any_dtype(timestamps):
+            if timestamps.dt.tz is None:
+                timestamps = timestamps.dt.tz_localize('UTC')
+        else:
+            timestamps = _parse_timestamps(timestamps)
         
-        # Filter data
-        recent_data = df[df[timestamp_col] >= cutoff_time]
+        # Filter data, comparing raw datetime64 values to skip index alignment
+        recent_data = df.loc[timestamps.values >= cutoff_time.to_numpy()]
         
         print(f"\nFound {len(recent_data)} records updated after {last_updated_at}")
         return recent_data
@@ -1,14 +1,28 @@
 import os
-import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import requests
-from typing import Dict, Any, List
-import pandas as pd
-from get_thread_insights import get_ontology_object, get_recent_data, create_attribute_table
+from typing import Dict, Any, List, Optional
+from get_thread_insights import search_ontology_object, ThreadInsight, create_session, json_dumps_bytes, json_loads, REQUEST_TIMEOUT
 import dotenv
 
 dotenv.load_dotenv()
 
+# Insights combined into one message; each takes 4 blocks plus a divider,
+# keeping a message well under Slack's 50-block limit
+INSIGHTS_PER_MESSAGE = 8
+
+# Slack's text limits for header and section blocks
+HEADER_TEXT_LIMIT = 150
+SECTION_TEXT_LIMIT = 3000
+
+def _truncate(text: str, limit: int) -> str:
+    """
+    Shorten text to at most limit characters, ending with "..." when cut.
+    """
+    if len(text) > limit:
+        return text[:limit - 3] + "..."
+    return text
+
 class SlackBot:
     def __init__(self, slack_token: str, channel_id: str):
         """
@@ -25,17 +39,46 @@ class SlackBot:
             "Authorization": f"Bearer {slack_token}",
             "Content-Type": "application/json"
         }
+        # Keep one warm connection to slack.com for all posts. Only 429s and connection
+        # failures are retried: Slack rejects rate-limited posts outright and a failed connect
+        # never reached it, while resending after a 5xx or read timeout could duplicate a post.
+        self.session = create_session(
+            pool_connections=1,
+            pool_maxsize=1,
+            status_forcelist=(429,),
+            allowed_methods=("POST",),
+            retry_reads=False
+        )
+        self.session.headers.update(self.headers)
+    
+    def __enter__(self) -> "SlackBot":
+        return self
     
-    def post_message(self, text: str, blocks: List[Dict[str, Any]] = None) -> bool:
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Close the bot's HTTP session and its pooled connections.
+        """
+        self.session.close()
+    
+    def post_message(
+        self,
+        text: str,
+        blocks: List[Dict[str, Any]] = None,
+        thread_ts: Optional[str] = None
+    ) -> Optional[str]:
         """
         Post a message to the specified Slack channel.
         
         Args:
             text: The message text (fallback text if blocks fail to render)
             blocks: Optional message blocks for rich formatting
+            thread_ts: Optional timestamp of a parent message to reply in its thread
             
         Returns:
-            bool: True if message was posted successfully
+            The posted message's ts if it was posted successfully, otherwise None
         """
         url = f"{self.base_url}/chat.postMessage"
         payload = {
@@ -45,24 +88,28 @@ class SlackBot:
         
         if blocks:
             payload["blocks"] = blocks
+        
+        if thread_ts:
+            payload["thread_ts"] = thread_ts
             
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self.session.post(url, data=json_dumps_bytes(payload), timeout=REQUEST_TIMEOUT)
             response.raise_for_status()  # Raise an exception for bad status codes
             
-            response_data = response.json()
+            response_data = json_loads(response.content)
             if not response_data.get("ok"):
                 print(f"Slack API error: {response_data.get('error', 'Unknown error')}")
                 print(f"Response data: {response_data}")
-                return False
+                return None
                 
-            return True
+            return response_data.get("ts")
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # ValueError covers a non-JSON response body
             print(f"Error posting to Slack: {str(e)}")
-            return False
+            return None
     
-    def format_insight_message(self, insight: Dict[str, Any]) -> Dict[str, Any]:
+    def format_insight_message(self, insight: ThreadInsight) -> List[Dict[str, Any]]:
         """
         Format a thread insight into a Slack message block.
         
@@ -70,62 +117,67 @@ class SlackBot:
             insight: The thread insight data
             
         Returns:
-            Dict containing formatted message blocks
+            List containing formatted message blocks
         """
-        # Initialize blocks list
-        blocks = []
-        
-        # Extract fields from the insight
-        title = insight.get("insightTitle", "Untitled Insight")
-        insight_evidence = insight.get("insightEvidence", "No evidence available")
-        sender_role = insight.get("senderRole", "Unknown role")
-        org_domain = insight.get("organizationDomain", "Unknown domain")
-        insight_type = insight.get("insightType", "Unknown type")
-        deidentified_summary = insight.get("deIdentifiedInsightSummary", "No de-identified summary available")
-        
-        # Truncate title if too long (max 150 chars for header)
-        if len(title) > 150:
-            title = title[:147] + "..."
-        
-        # Add header block with the title
-        blocks.append({
-            "type": "header",
-            "text": {
+        # Build the header, de-identified summary, evidence and metadata blocks in a
+        # single literal; this is cheaper than appending or copying a template. Every
+        # text is cut to Slack's limit, which would otherwise reject the whole message.
+        return [
+            {"type": "header", "text": {
                 "type": "plain_text",
-                "text": title,
+                "text": _truncate(insight.insightTitle, HEADER_TEXT_LIMIT),
                 "emoji": True
-            }
-        })
-        
-        # Add de-identified summary block
-        blocks.append({
-            "type": "section",
-            "text": {
+            }},
+            {"type": "section", "text": {
                 "type": "mrkdwn",
-                "text": f"*De-identified Summary:*\n{deidentified_summary}"
-            }
-        })
-        
-        # Add insight evidence block
-        blocks.append({
-            "type": "section",
-            "text": {
+                "text": _truncate(f"*De-identified Summary:*\n{insight.deIdentifiedInsightSummary}", SECTION_TEXT_LIMIT)
+            }},
+            {"type": "section", "text": {
                 "type": "mrkdwn",
-                "text": f"*Evidence:*\n{insight_evidence}"
-            }
-        })
-        
-        # Add metadata block
-        metadata_text = f"*Type:* {insight_type}\n*Sender Role:* {sender_role}\n*Organization:* {org_domain}"
-        blocks.append({
-            "type": "section",
-            "text": {
+                "text": _truncate(f"*Evidence:*\n{insight.insightEvidence}", SECTION_TEXT_LIMIT)
+            }},
+            {"type": "section", "text": {
                 "type": "mrkdwn",
-                "text": metadata_text
-            }
-        })
+                "text": _truncate(
+                    f"*Type:* {insight.insightType}\n"
+                    f"*Sender Role:* {insight.senderRole}\n"
+                    f"*Organization:* {insight.organizationDomain}",
+                    SECTION_TEXT_LIMIT
+                )
+            }}
+        ]
+    
+    def post_insights(self, insights: List[ThreadInsight], thread_ts: Optional[str] = None) -> bool:
+        """
+        Format a batch of thread insights and post them as a single message.
+        
+        Args:
+            insights: The thread insights to include, at most INSIGHTS_PER_MESSAGE
+            thread_ts: Optional timestamp of the summary message to reply under
+            
+        Returns:
+            bool: True if all of the insights were posted successfully
+        """
+        # Concatenate each insight's blocks, separated by dividers
+        blocks = []
+        for insight in insights:
+            if blocks:
+                blocks.append({"type": "divider"})
+            blocks.extend(self.format_insight_message(insight))
+        
+        # Create a fallback text for the insights
+        fallback_text = "\n".join(f"New Thread Insight: {insight.deIdentifiedInsightSummary}" for insight in insights)
+        
+        if self.post_message(fallback_text, blocks, thread_ts=thread_ts) is not None:
+            return True
+        
+        # Repost a failed batch one insight at a time so a single bad insight doesn't drop the rest
+        if len(insights) > 1:
+            results = [self.post_insights([insight], thread_ts) for insight in insights]
+            return all(results)
         
-        return blocks
+        print(f"Failed to post insight: {insights[0].internalInsightId or 'Unknown ID'}")
+        return False
     
     def get_and_post_recent_insights(
         self,
@@ -133,7 +185,6 @@ class SlackBot:
         ontology_rid: str,
         bearer_token: str,
         object_type: str = "ThreadInsight",
-        primary_key: str = "internalInsightId",
         hours: int = 24
     ) -> None:
         """
@@ -144,68 +195,63 @@ class SlackBot:
             ontology_rid: Ontology RID
             bearer_token: Foundry bearer token
             object_type: Type of object to fetch
-            primary_key: Primary key for the object
             hours: Number of hours to look back for recent insights (default 24 for daily)
         """
         try:
-            # Get all insights
-            insights = get_ontology_object(
+            # Calculate cutoff for the lookback window
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+            cutoff_iso = cutoff.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+            
+            # Let Foundry filter to recent insights instead of downloading the full history,
+            # decoding them straight into ThreadInsight records
+            recent_insights = search_ontology_object(
                 base_url=foundry_url,
                 ontology_rid=ontology_rid,
                 object_name=object_type,
-                primary_key=primary_key,
-                bearer_token=bearer_token
+                query={"type": "gte", "field": "properties.timestamp", "value": cutoff_iso},
+                bearer_token=bearer_token,
+                decode=ThreadInsight.from_object
             )
             
-            if not insights:
-                self.post_message("No new thread insights found in the last 24 hours.")
+            if not recent_insights:
+                self.post_message(f"No new thread insights found in the last {hours} hours.")
                 return
             
-            # Convert to DataFrame
-            df = create_attribute_table(insights)
-            
-            # Calculate timestamp for last 24 hours
-            last_day = (datetime.utcnow() - timedelta(hours=hours)).isoformat() + "Z"
-            
-            # Get recent insights
-            recent_insights = get_recent_data(df, "timestamp", last_day)
-            
-            if recent_insights.empty:
-                self.post_message("No new thread insights found in the last 24 hours.")
-                return
+            # Post a summary message first; the insights go in its thread
+            summary_text = f"*Daily Thread Insights Update*\nFound {len(recent_insights)} new insights in the last {hours} hours."
+            thread_ts = self.post_message(summary_text)
             
-            # Post a summary message first
-            summary_text = f"*Daily Thread Insights Update*\nFound {len(recent_insights)} new insights in the last 24 hours."
-            self.post_message(summary_text)
+            # Group the insights so each reply carries several of them
+            batches = [
+                recent_insights[i:i + INSIGHTS_PER_MESSAGE]
+                for i in range(0, len(recent_insights), INSIGHTS_PER_MESSAGE)
+            ]
             
-            # Post each insight
-            for _, insight in recent_insights.iterrows():
-                insight_dict = insight.to_dict()
-                blocks = self.format_insight_message(insight_dict)
-                
-                # Create a fallback text for the insight
-                fallback_text = f"New Thread Insight: {insight_dict.get('deIdentifiedInsightSummary', 'Untitled Insight')}"
-                
-                success = self.post_message(fallback_text, blocks)
-                if not success:
-                    print(f"Failed to post insight: {insight_dict.get('internalInsightId', 'Unknown ID')}")
-                time.sleep(1)  # Avoid rate limiting
+            # Post the replies in order; Slack allows about one message per second per
+            # channel, so there is nothing to gain from posting them concurrently
+            for batch in batches:
+                self.post_insights(batch, thread_ts)
             
         except Exception as e:
             error_message = f"Error fetching and posting insights: {str(e)}"
             self.post_message(error_message)
             print(error_message)
 
-def run_daily_bot(
+def run_once(
     slack_token: str,
     channel_id: str,
     foundry_url: str,
     ontology_rid: str,
     bearer_token: str,
-    interval_hours: int = 24
+    hours: int = 24
 ) -> None:
     """
-    Run the Slack bot to post insights daily.
+    Fetch the recent insights and post them to Slack once, then return.
+    
+    Scheduling is left to the host so no process sits idle between runs, e.g. a
+    daily crontab entry at 09:00 UTC:
+    
+        0 9 * * * cd /path/to/bot && python slack_bot.py
     
     Args:
         slack_token: Slack API token
@@ -213,25 +259,16 @@ def run_daily_bot(
         foundry_url: Foundry instance URL
         ontology_rid: Ontology RID
         bearer_token: Foundry bearer token
-        interval_hours: Interval in hours between posts (default 24 for daily)
+        hours: Number of hours to look back, matching the schedule interval (default 24 for daily)
     """
-    bot = SlackBot(slack_token, channel_id)
-    
-    while True:
-        try:
-            print(f"Fetching insights at {datetime.utcnow().isoformat()}")
-            bot.get_and_post_recent_insights(
-                foundry_url=foundry_url,
-                ontology_rid=ontology_rid,
-                bearer_token=bearer_token
-            )
-            
-            # Wait for the next interval
-            time.sleep(interval_hours * 3600)
-            
-        except Exception as e:
-            print(f"Error in daily bot: {str(e)}")
-            time.sleep(300)  # Wait 5 minutes before retrying
+    with SlackBot(slack_token, channel_id) as bot:
+        print(f"Fetching insights at {datetime.now(timezone.utc).isoformat()}")
+        bot.get_and_post_recent_insights(
+            foundry_url=foundry_url,
+            ontology_rid=ontology_rid,
+            bearer_token=bearer_token,
+            hours=hours
+        )
 
 if __name__ == "__main__":
     # Load configuration from environment variables
@@ -251,8 +288,8 @@ if __name__ == "__main__":
         print("- FOUNDRY_BEARER_TOKEN: Your Foundry bearer token")
         exit(1)
     
-    # Start the daily bot
-    run_daily_bot(
+    # Post the insights once; run this from cron or a systemd timer
+    run_once(
         slack_token=SLACK_TOKEN,
         channel_id=CHANNEL_ID,
         foundry_url=FOUNDRY_URL,